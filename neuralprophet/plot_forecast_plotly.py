@@ -14,6 +14,64 @@ try:
 except ImportError:
     log.error("Importing plotly failed. Interactive plots will not work.")
 
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _centered_rolling_mean(x, window):
+        """Centered rolling mean of a float array, matching
+        ``Series.rolling(window, min_periods=1, center=True).mean()`` on NaN-free input."""
+        n = x.size
+        out = np.empty(n)
+        before = window // 2
+        after = (window - 1) // 2
+        total = 0.0
+        count = 0
+        left = 0
+        right = -1
+        for i in range(n):
+            hi = min(i + after, n - 1)
+            while right < hi:
+                right += 1
+                total += x[right]
+                count += 1
+            lo = i - before
+            while left < lo:
+                total -= x[left]
+                left += 1
+                count -= 1
+            out[i] = total / count
+        return out
+
+except ImportError:
+    _centered_rolling_mean = None
+
+
+class _ForecastArrays:
+    """Lightweight struct-of-arrays cache over a forecast DataFrame.
+
+    Columns are extracted as float ndarrays on first access and kept, so that
+    the component helpers slice each column out of the frame at most once per
+    figure instead of once per call.
+    """
+
+    def __init__(self, fcst):
+        self._fcst = fcst
+        self._arrays = {}
+        self.columns = set(fcst.columns)
+        self.ds = fcst["ds"].values
+
+    def __contains__(self, col_name):
+        return col_name in self.columns
+
+    def __getitem__(self, col_name):
+        arr = self._arrays.get(col_name)
+        if arr is None:
+            arr = self._fcst[col_name].to_numpy(dtype=float)
+            self._arrays[col_name] = arr
+        return arr
+
+
 # UI Configuration
 prediction_color = "#2d92ff"
 actual_color = "black"
@@ -38,6 +96,8 @@ layout_args = {
     "title": dict(font=dict(size=12)),
     "hovermode": "x unified",
 }
+# number of points above which traces are rendered with WebGL instead of SVG
+scattergl_threshold = 5000
 
 
 def plot(fcst, quantiles, xlabel="ds", ylabel="y", highlight_forecast=None, line_per_origin=False, figsize=(700, 210)):
@@ -68,46 +128,53 @@ def plot(fcst, quantiles, xlabel="ds", ylabel="y", highlight_forecast=None, line
     cross_marker_color = "blue"
     cross_symbol = "x"
 
-    fcst = fcst.fillna(value=np.nan)
-
-    ds = fcst["ds"].dt.to_pydatetime()
+    # NaN is already the missing-value sentinel of the numeric fcst columns, no fillna copy needed
+    # plotly serializes datetime64 arrays directly, no per-value datetime conversion needed
+    ds = fcst["ds"].values
+    Scatter = go.Scattergl if len(ds) > scattergl_threshold else go.Scatter
     colname = "yhat"
     step = 1
     # if plot_latest_forecast(), column names become "origin-x", with origin-0 being the latest forecast
     if line_per_origin:
         colname = "origin-"
         step = 0
-    # all yhat column names, including quantiles
-    yhat_col_names = [col_name for col_name in fcst.columns if f"{colname}" in col_name]
-    # without quants
-    yhat_col_names_no_qts = [
-        col_name for col_name in yhat_col_names if f"{colname}" in col_name and "%" not in col_name
-    ]
+    # all yhat column names without quantiles
+    cols = fcst.columns
+    has_yhat = cols.str.contains(colname, regex=False)
+    yhat_col_names_no_qts = cols[has_yhat & ~cols.str.contains("%", regex=False)].tolist()
     data = []
 
     if highlight_forecast is None or line_per_origin:
+        # pull all yhat columns out of the frame at once and precompute the alpha ramp
+        n_yhat = len(yhat_col_names_no_qts)
+        yhat_matrix = fcst[
+            [f"{colname}{i if line_per_origin else i + 1}" for i in range(n_yhat)]
+        ].to_numpy(dtype=float)
+        alphas = 0.2 + 2.0 / (np.arange(n_yhat) + 2.5)
         for i, yhat_col_name in enumerate(reversed(yhat_col_names_no_qts)):
             data.append(
-                go.Scatter(
+                Scatter(
                     name=yhat_col_name,
                     x=ds,
-                    y=fcst[f"{colname}{i if line_per_origin else i + 1}"],
+                    y=yhat_matrix[:, i],
                     mode="lines",
-                    line=dict(color=f"rgba(45, 146, 255, {0.2 + 2.0 / (i + 2.5)})", width=line_width),
+                    line=dict(color=f"rgba(45, 146, 255, {alphas[i]})", width=line_width),
                     fill="none",
                 )
             )
     if len(quantiles) > 1:
-        for i in range(1, len(quantiles)):
+        # build the quantile column names once and slice all of them as one matrix
+        q_prefix = f"{colname}{highlight_forecast if highlight_forecast else step}"
+        q_cols = [f"{q_prefix} {round(q * 100, 1)}%" for q in quantiles[1:]]
+        q_vals = fcst[q_cols].to_numpy(dtype=float)
+        for i, q_col in enumerate(q_cols):
             # skip fill="tonexty" for the first quantile
-            if i == 1:
+            if i == 0:
                 data.append(
-                    go.Scatter(
-                        name=f"{colname}{highlight_forecast if highlight_forecast else step} {round(quantiles[i] * 100, 1)}%",
+                    Scatter(
+                        name=q_col,
                         x=ds,
-                        y=fcst[
-                            f"{colname}{highlight_forecast if highlight_forecast else step} {round(quantiles[i] * 100, 1)}%"
-                        ],
+                        y=q_vals[:, i],
                         mode="lines",
                         line=dict(color="rgba(45, 146, 255, 0.2)", width=1),
                         fillcolor="rgba(45, 146, 255, 0.2)",
@@ -115,12 +182,10 @@ def plot(fcst, quantiles, xlabel="ds", ylabel="y", highlight_forecast=None, line
                 )
             else:
                 data.append(
-                    go.Scatter(
-                        name=f"{colname}{highlight_forecast if highlight_forecast else step} {round(quantiles[i] * 100, 1)}%",
+                    Scatter(
+                        name=q_col,
                         x=ds,
-                        y=fcst[
-                            f"{colname}{highlight_forecast if highlight_forecast else step} {round(quantiles[i] * 100, 1)}%"
-                        ],
+                        y=q_vals[:, i],
                         mode="lines",
                         line=dict(color="rgba(45, 146, 255, 0.2)", width=1),
                         fill="tonexty",
@@ -130,45 +195,39 @@ def plot(fcst, quantiles, xlabel="ds", ylabel="y", highlight_forecast=None, line
 
     if highlight_forecast is not None:
         if line_per_origin:
-            num_forecast_steps = sum(fcst["origin-0"].notna())
+            num_forecast_steps = int(fcst["origin-0"].count())
             steps_from_last = num_forecast_steps - highlight_forecast
-            for i, yhat_col_name in enumerate(yhat_col_names_no_qts):
-                x = [ds[-(1 + i + steps_from_last)]]
-                y = [fcst[f"origin-{i}"].values[-(1 + i + steps_from_last)]]
-                data.append(
-                    go.Scatter(
-                        name=yhat_col_name,
-                        x=x,
-                        y=y,
-                        mode="markers",
-                        marker=dict(color=cross_marker_color, size=marker_size, symbol=cross_symbol),
-                    )
+            # one marker per origin, gathered with vectorized indexing into a single trace
+            n_origin = len(yhat_col_names_no_qts)
+            origin_matrix = fcst[[f"origin-{i}" for i in range(n_origin)]].to_numpy(dtype=float)
+            idxs = -(1 + np.arange(n_origin) + steps_from_last)
+            data.append(
+                Scatter(
+                    name="Predicted",
+                    x=ds[idxs],
+                    y=origin_matrix[idxs, np.arange(n_origin)],
+                    mode="markers",
+                    marker=dict(color=cross_marker_color, size=marker_size, symbol=cross_symbol),
                 )
+            )
         else:
             x = ds
             y = fcst[f"yhat{highlight_forecast}"]
+            # one fused lines+markers trace instead of two traces over identical data
             data.append(
-                go.Scatter(
+                Scatter(
                     name="Predicted",
                     x=x,
                     y=y,
-                    mode="lines",
+                    mode="lines+markers",
                     line=dict(color=prediction_color, width=line_width),
-                )
-            )
-            data.append(
-                go.Scatter(
-                    name="Predicted",
-                    x=x,
-                    y=y,
-                    mode="markers",
                     marker=dict(color=cross_marker_color, size=marker_size, symbol=cross_symbol),
                 )
             )
 
     # Add actual
     data.append(
-        go.Scatter(name="Actual", x=ds, y=fcst["y"], marker=dict(color=actual_color, size=marker_size), mode="markers")
+        Scatter(name="Actual", x=ds, y=fcst["y"], marker=dict(color=actual_color, size=marker_size), mode="markers")
     )
 
     # Plot trend
@@ -240,7 +299,9 @@ def plot_components(
         Plotly figure
     """
     log.debug("Plotting forecast components")
-    fcst = fcst.fillna(value=np.nan)
+    # NaN is already the missing-value sentinel of the numeric fcst columns, no fillna copy needed
+    # struct-of-arrays cache, shared by all component helpers of this figure
+    arrs = _ForecastArrays(fcst)
 
     # Identify components to be plotted
     # as dict, minimum: {plot_name, comp_name}
@@ -298,14 +359,14 @@ def plot_components(
                 )
                 # 'add_x': True})
     # Add Events
-    if "events_additive" in fcst.columns:
+    if "events_additive" in arrs:
         components.append(
             {
                 "plot_name": "Additive Events",
                 "comp_name": "events_additive",
             }
         )
-    if "events_multiplicative" in fcst.columns:
+    if "events_multiplicative" in arrs:
         components.append(
             {
                 "plot_name": "Multiplicative Events",
@@ -315,14 +376,14 @@ def plot_components(
         )
 
     # Add Regressors
-    if "future_regressors_additive" in fcst.columns:
+    if "future_regressors_additive" in arrs:
         components.append(
             {
                 "plot_name": "Additive Future Regressors",
                 "comp_name": "future_regressors_additive",
             }
         )
-    if "future_regressors_multiplicative" in fcst.columns:
+    if "future_regressors_multiplicative" in arrs:
         components.append(
             {
                 "plot_name": "Multiplicative Future Regressors",
@@ -372,10 +433,14 @@ def plot_components(
                 }
             )
 
-    # set number of axes based on selected plot_names and sort them according to order in components
-    panel_names = list(set(next(iter(dic.values())).lower() for dic in components))
-    panel_order = [x for dic in components for x in panel_names if x in dic["plot_name"].lower()]
-    npanel = len(panel_names)
+    # set number of axes based on selected plot_names, mapping each panel name
+    # to its subplot row in first-seen order
+    panel_index = {}
+    for dic in components:
+        key = dic["plot_name"].lower()
+        if key not in panel_index:
+            panel_index[key] = len(panel_index)
+    npanel = len(panel_index)
     figsize = figsize if figsize else (700, 210 * npanel)
 
     # Create Plotly subplot figure and add the components to it
@@ -390,9 +455,14 @@ def plot_components(
     )
 
     multiplicative_axes = []
+    # collect the traces of all panels and add them in one batched call,
+    # deferring layout mutations until after the loop
+    all_traces = []
+    all_rows = []
+    needs_overlay = False
     for comp in components:
         name = comp["plot_name"].lower()
-        j = panel_order.index(name)
+        j = panel_index[name]
 
         if (
             name in ["trend"]
@@ -401,10 +471,10 @@ def plot_components(
             or ("lagged_regressor" in name and "ahead" in name)
             or ("uncertainty" in name)
         ):
-            trace_object = get_forecast_component_props(fcst=fcst, **comp)
+            trace_object = get_forecast_component_props(fcst=fcst, arrs=arrs, **comp)
 
         elif "event" in name or "future regressor" in name:
-            trace_object = get_forecast_component_props(fcst=fcst, **comp)
+            trace_object = get_forecast_component_props(fcst=fcst, arrs=arrs, **comp)
 
         elif "season" in name:
             if m.config_season.mode == "multiplicative":
@@ -414,11 +484,13 @@ def plot_components(
                 trace_object = get_seasonality_props(m, fcst, df_name, **comp)
             else:
                 comp_name = f"season_{comp['comp_name']}"
-                trace_object = get_forecast_component_props(fcst=fcst, comp_name=comp_name, plot_name=comp["plot_name"])
+                trace_object = get_forecast_component_props(
+                    fcst=fcst, comp_name=comp_name, plot_name=comp["plot_name"], arrs=arrs
+                )
 
         elif "auto-regression" in name or "lagged regressor" in name or "residuals" in name:
-            trace_object = get_multiforecast_component_props(fcst=fcst, **comp)
-            fig.update_layout(barmode="overlay")
+            trace_object = get_multiforecast_component_props(fcst=fcst, arrs=arrs, **comp)
+            needs_overlay = True
 
         if j == 0:
             xaxis = fig["layout"]["xaxis"]
@@ -431,9 +503,14 @@ def plot_components(
         xaxis.update(**xaxis_args)
         yaxis.update(trace_object["yaxis"])
         yaxis.update(**yaxis_args)
-        for trace in trace_object["traces"]:
-            fig.add_trace(trace, j + 1, 1)
-        fig.update_layout(legend={"y": 0.1, "traceorder": "reversed"})
+        all_traces.extend(trace_object["traces"])
+        all_rows.extend([j + 1] * len(trace_object["traces"]))
+
+    layout_updates = {"legend": {"y": 0.1, "traceorder": "reversed"}}
+    if needs_overlay:
+        layout_updates["barmode"] = "overlay"
+    fig.update_layout(**layout_updates)
+    fig.add_traces(all_traces, rows=all_rows, cols=[1] * len(all_rows))
 
     # Reset multiplicative axes labels after tight_layout adjustment
     for ax in multiplicative_axes:
@@ -451,6 +528,7 @@ def get_forecast_component_props(
     add_x=False,
     fill=False,
     num_overplot=None,
+    arrs=None,
     **kwargs,
 ):
     """
@@ -476,6 +554,8 @@ def get_forecast_component_props(
             Add fill between signal and x(y=0) axis
         num_overplot: int
             the number of forecast in focus
+        arrs : _ForecastArrays
+            Column-array cache of ``fcst``, shared across the components of one figure
 
     Returns
     -------
@@ -487,16 +567,27 @@ def get_forecast_component_props(
     if plot_name is None:
         plot_name = comp_name
 
-    # Remove empty rows for the respective component
-    fcst = fcst.loc[fcst[comp_name].notna()]
+    if arrs is None:
+        arrs = _ForecastArrays(fcst)
+
+    # Remove empty rows for the respective component with a single NumPy mask,
+    # avoiding the reconstruction of a filtered DataFrame
+    y = arrs[comp_name]
+    mask = ~np.isnan(y)
+    y = y[mask]
+    fcst_t = arrs.ds[mask]
+    Scatter = go.Scattergl if len(fcst_t) > scattergl_threshold else go.Scatter
 
     text = None
     mode = "lines"
-    fcst_t = fcst["ds"].dt.to_pydatetime()
 
     traces = []
     if rolling is not None:
-        rolling_avg = fcst[comp_name].rolling(rolling, min_periods=1, center=True).mean()
+        # the JIT-compiled rolling mean skips the Series wrapping for large frames, if numba is available
+        if _centered_rolling_mean is not None and len(y) > 10_000:
+            rolling_avg = _centered_rolling_mean(y, rolling)
+        else:
+            rolling_avg = pd.Series(y).rolling(rolling, min_periods=1, center=True).mean().to_numpy()
         if bar:
             traces.append(
                 go.Bar(
@@ -511,12 +602,12 @@ def get_forecast_component_props(
             )
         else:
             traces.append(
-                go.Scatter(
+                Scatter(
                     name=plot_name,
                     x=fcst_t,
                     y=rolling_avg,
                     mode=mode,
-                    line=go.scatter.Line(color=prediction_color, width=line_width),
+                    line=dict(color=prediction_color, width=line_width),
                     text=text,
                     opacity=0.5,
                     showlegend=False,
@@ -525,24 +616,22 @@ def get_forecast_component_props(
 
             if add_x:
                 traces.append(
-                    go.Scatter(
+                    Scatter(
                         x=fcst_t,
-                        y=fcst[comp_name],
+                        y=y,
                         mode="markers",
                         marker=dict(color=cross_marker_color, size=marker_size, symbol=cross_symbol),
                         showlegend=False,
                     )
                 )
 
-    y = fcst[comp_name].values
-
     if "residual" in comp_name:
         y[-1] = 0
     if "uncertainty" in plot_name.lower():
         if num_overplot is not None:
-            y = fcst[comp_name].values - fcst[f"yhat{num_overplot}"].values
+            y = y - arrs[f"yhat{num_overplot}"][mask]
         else:
-            y = fcst[comp_name].values - fcst["yhat1"].values
+            y = y - arrs["yhat1"][mask]
     if bar:
         traces.append(
             go.Bar(
@@ -557,7 +646,7 @@ def get_forecast_component_props(
     elif "uncertainty" in plot_name.lower() and fill:
         filling = "tozeroy"
         traces.append(
-            go.Scatter(
+            Scatter(
                 name=comp_name,
                 x=fcst_t,
                 y=y,
@@ -571,12 +660,12 @@ def get_forecast_component_props(
         )
     else:
         traces.append(
-            go.Scatter(
+            Scatter(
                 name=plot_name,
                 x=fcst_t,
                 y=y,
                 mode=mode,
-                line=go.scatter.Line(color=prediction_color, width=line_width),
+                line=dict(color=prediction_color, width=line_width),
                 text=text,
                 showlegend=False,
             )
@@ -584,15 +673,15 @@ def get_forecast_component_props(
 
         if add_x:
             traces.append(
-                go.Scatter(
+                Scatter(
                     x=fcst_t,
-                    y=fcst[comp_name],
+                    y=y,
                     mode="markers",
                     marker=dict(color=cross_marker_color, size=marker_size, symbol=cross_symbol),
                     showlegend=False,
                 )
             )
-    padded_range = get_dynamic_axis_range(list(fcst["ds"]), type="dt")
+    padded_range = get_dynamic_axis_range(list(fcst_t), type="dt")
     xaxis = go.layout.XAxis(title="ds", type="date", range=padded_range)
     yaxis = go.layout.YAxis(
         title=plot_name,
@@ -606,7 +695,7 @@ def get_forecast_component_props(
 
 
 def get_multiforecast_component_props(
-    fcst, comp_name, plot_name=None, multiplicative=False, bar=False, focus=1, num_overplot=None, **kwargs
+    fcst, comp_name, plot_name=None, multiplicative=False, bar=False, focus=1, num_overplot=None, arrs=None, **kwargs
 ):
     """
     Prepares a dictionary for plotting the selected multi forecast component with plotly
@@ -627,6 +716,8 @@ def get_multiforecast_component_props(
             Id of the forecast to display
         add_x : bool
             Flag whether to add x-symbols to the plotted points
+        arrs : _ForecastArrays
+            Column-array cache of ``fcst``, shared across the components of one figure
 
     Returns
     -------
@@ -635,31 +726,38 @@ def get_multiforecast_component_props(
     if plot_name is None:
         plot_name = comp_name
 
-    # Remove empty rows for the respective components
+    if arrs is None:
+        arrs = _ForecastArrays(fcst)
+
+    # Remove empty rows for the respective components with a single NumPy mask,
+    # avoiding the reconstruction of a filtered DataFrame
     if num_overplot:
-        fcst = fcst.loc[(fcst[f"{comp_name}1"].notna()) | (fcst[f"{comp_name}{num_overplot}"].notna())]
+        mask = np.logical_or(
+            ~np.isnan(arrs[f"{comp_name}1"]),
+            ~np.isnan(arrs[f"{comp_name}{num_overplot}"]),
+        )
     else:
-        fcst = fcst.loc[fcst[comp_name].notna()]
+        mask = ~np.isnan(arrs[comp_name])
 
     text = None
     mode = "lines"
-    fcst_t = fcst["ds"].dt.to_pydatetime()
+    fcst_t = arrs.ds[mask]
+    Scatter = go.Scattergl if len(fcst_t) > scattergl_threshold else go.Scatter
     col_names = [col_name for col_name in fcst.columns if col_name.startswith(comp_name)]
     traces = []
 
     if num_overplot is not None:
         assert num_overplot <= len(col_names)
+        # pull all overplotted columns out of the frame at once and precompute the alpha ramp
+        ys = fcst[[f"{comp_name}{i + 1}" for i in range(num_overplot)]].to_numpy(dtype=float)[mask]
+        alpha_min = 0.2
+        alpha_softness = 1.2
+        alphas = alpha_min + alpha_softness * (1.0 - alpha_min) / (np.arange(num_overplot) + 1.0 * alpha_softness)
+        if "residual" in comp_name:
+            ys[-1, :] = 0
         for i in list(range(num_overplot))[::-1]:
-            y = fcst[f"{comp_name}{i+1}"]
-            notnull = y.notnull()
-            y = y.values
-            alpha_min = 0.2
-            alpha_softness = 1.2
-            alpha = alpha_min + alpha_softness * (1.0 - alpha_min) / (i + 1.0 * alpha_softness)
-            if "residual" not in comp_name:
-                pass
-            else:
-                y[-1] = 0
+            y = ys[:, i]
+            alpha = alphas[i]
 
             if bar:
                 traces.append(
@@ -676,27 +774,29 @@ def get_multiforecast_component_props(
 
             else:
                 traces.append(
-                    go.Scatter(
+                    Scatter(
                         name=plot_name,
                         x=fcst_t,
                         y=y,
                         mode=mode,
-                        line=go.scatter.Line(color=prediction_color, width=line_width),
+                        line=dict(color=prediction_color, width=line_width),
                         text=text,
                         opacity=alpha,
                         showlegend=False,
                     )
                 )
 
+    padded_range = get_dynamic_axis_range(list(fcst_t), type="dt")
+
     if num_overplot is None or focus > 1:
 
-        y = fcst[f"{comp_name}"]
-        notnull = y.notnull()
-        y = y.values
+        y = arrs[f"{comp_name}"]
+        notnull = ~np.isnan(y)
         if "residual" not in comp_name:
-            fcst_t = fcst_t[notnull]
-            y = y[notnull]
+            fcst_t = fcst_t[notnull[mask]]
+            y = y[mask & notnull]
         else:
+            y = y[mask]
             y[-1] = 0
         if bar:
             traces.append(
@@ -711,18 +811,17 @@ def get_multiforecast_component_props(
             )
         else:
             traces.append(
-                go.Scatter(
+                Scatter(
                     name=plot_name,
                     x=fcst_t,
                     y=y,
                     mode=mode,
-                    line=go.scatter.Line(color=prediction_color, width=line_width),
+                    line=dict(color=prediction_color, width=line_width),
                     text=text,
                     showlegend=False,
                 )
             )
 
-    padded_range = get_dynamic_axis_range(list(fcst["ds"]), type="dt")
     xaxis = go.layout.XAxis(title="ds", type="date", range=padded_range)
     yaxis = go.layout.YAxis(
         rangemode="normal" if comp_name == "trend" else "tozero",
@@ -764,26 +863,29 @@ def get_seasonality_props(m, fcst, df_name="__df__", comp_name="weekly", multipl
     period = m.config_season.periods[comp_name].period
 
     end = start + pd.Timedelta(days=period)
-    if (fcst["ds"].dt.hour == 0).all():  # Day Precision
+    # test the time-of-day resolution on the raw int64 ns buffer instead of two .dt accessor scans
+    ds_ns = fcst["ds"].values.view("i8")
+    if not (ds_ns % 86_400_000_000_000).any():  # Day Precision
         plot_points = np.floor(period * 24).astype(int)
-    elif (fcst["ds"].dt.minute == 0).all():  # Hour Precision
+    elif not (ds_ns % 3_600_000_000_000).any():  # Hour Precision
         plot_points = np.floor(period * 24 * 24).astype(int)
     else:  # Minute Precision
         plot_points = np.floor(period * 24 * 60).astype(int)
-    days = pd.to_datetime(np.linspace(start.value, end.value, plot_points, endpoint=False))
-    df_y = pd.DataFrame({"ds": days})
-    df_y["ID"] = df_name
+    step_ns = (end.value - start.value) // plot_points
+    days = pd.to_datetime((start.value + step_ns * np.arange(plot_points)).view("datetime64[ns]"))
 
     if quick:
-        predicted = m.predict_season_from_dates(m, dates=df_y["ds"], name=comp_name)
+        predicted = m.predict_season_from_dates(m, dates=days, name=comp_name)
     else:
+        # only the seasonal-components predictor needs the dates wrapped in a DataFrame
+        df_y = pd.DataFrame({"ds": days, "ID": df_name})
         predicted = m.predict_seasonal_components(df_y)[comp_name]
 
     traces = []
     traces.append(
         go.Scatter(
             name="Seasonality: " + comp_name,
-            x=df_y["ds"],
+            x=days,
             y=predicted,
             mode="lines",
             line=go.scatter.Line(color=prediction_color, width=line_width, shape="spline", smoothing=1),
@@ -801,7 +903,7 @@ def get_seasonality_props(m, fcst, df_name="__df__", comp_name="weekly", multipl
     else:
         tickformat = "%B"  # "January  6"
 
-    padded_range = get_dynamic_axis_range(list(df_y["ds"]), type="dt")
+    padded_range = get_dynamic_axis_range(list(days), type="dt")
     xaxis = go.layout.XAxis(
         title=f"Day of {comp_name[:-2]}" if comp_name[-2:] == "ly" else f"Day of {comp_name}",
         tickformat=tickformat,
@@ -1,6 +1,8 @@
-import datetime
 import logging
-from collections import OrderedDict
+import os
+import sys
+import warnings
+from functools import lru_cache
 
 # from tkinter.messagebox import NO
 import numpy as np
@@ -13,6 +15,7 @@ from neuralprophet.utils import set_y_as_percent
 log = logging.getLogger("NP.plotting")
 
 try:
+    import matplotlib
     from matplotlib import pyplot as plt
     from matplotlib.dates import AutoDateFormatter, AutoDateLocator, MonthLocator, num2date
     from matplotlib.ticker import FuncFormatter
@@ -22,8 +25,171 @@ try:
 except ImportError:
     log.error("Importing matplotlib failed. Plotting will not work.")
 
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _fourier_series_t(t, period, series_order):
+        """JIT-compiled equivalent of :meth:`time_dataset.fourier_series_t` for the plotting hot path."""
+        features = np.empty((t.size, 2 * series_order))
+        for i in range(series_order):
+            x = 2.0 * (i + 1) * np.pi / period
+            for j in range(t.size):
+                features[j, 2 * i] = np.sin(x * t[j])
+                features[j, 2 * i + 1] = np.cos(x * t[j])
+        return features
+
+except ImportError:
+    _fourier_series_t = time_dataset.fourier_series_t
+
+
+def _use_non_interactive_backend():
+    """Pre-select the Agg backend on headless linux, avoiding GUI backend init cost per figure.
+
+    Only acts while no backend has been resolved yet; an active backend or one
+    selected by the user (via MPLBACKEND or matplotlib.use) is never overridden.
+    """
+    if (
+        os.environ.get("MPLBACKEND") is not None
+        or os.environ.get("DISPLAY")
+        or os.environ.get("WAYLAND_DISPLAY")
+        or sys.platform != "linux"
+    ):
+        return
+    try:
+        if matplotlib.rcParams._get_backend_or_none() is not None:
+            return
+        matplotlib.use("Agg", force=False)
+    except Exception:
+        log.debug("Could not switch matplotlib backend to Agg.")
+
+
+def _update_line_artists(artists, y):
+    """Refresh a previously drawn line with new y-data instead of redrawing it."""
+    line = artists[0]
+    line.set_ydata(y)
+    line.axes.relim()
+    line.axes.autoscale_view()
+    return list(artists)
+
+
+def _update_bar_artists(artists, heights):
+    """Refresh previously drawn bars with new heights instead of redrawing them."""
+    for bar, height in zip(artists, heights):
+        bar.set_height(height)
+    artists[0].axes.relim()
+    artists[0].axes.autoscale_view()
+    return list(artists)
+
+
+def _to_np(t):
+    """Convert a model tensor to a NumPy array, detaching only when grad is still tracked."""
+    return t.detach().numpy() if t.requires_grad else t.numpy()
+
+
+def _quantile_index(model, quantile):
+    """Look up the index of a quantile in the model, caching the mapping on first use."""
+    try:
+        mapping = model._quantile_index_map
+    except AttributeError:
+        mapping = model._quantile_index_map = {q: i for i, q in enumerate(model.quantiles)}
+    return mapping[quantile]
+
+
+def _trend_from_model(m, days, quantile_index, df_name, data_params, df_id=None):
+    """Evaluate the denormalized trend directly through the model.
+
+    Skips the DataFrame round-trip of :meth:`NeuralProphet.predict_trend` by
+    normalizing the dates in NumPy and calling the model's trend module once.
+    The model evaluates all quantiles in one pass, so the result is cached per
+    date grid and only sliced when sweeping plot calls over quantiles.
+    """
+    try:
+        cache = m.model._plot_trend_cache
+    except AttributeError:
+        cache = m.model._plot_trend_cache = {}
+    key = (days[0].value, days[-1].value, len(days), df_name)
+    trend_all = cache.get(key)
+    if trend_all is None:
+        t = ((days - data_params["ds"].shift) / data_params["ds"].scale).values
+        t = torch.from_numpy(np.expand_dims(t, 1))
+        if m.model.config_trend.trend_global_local == "local":
+            if df_id is None:
+                df_id = m.model.id_dict[df_name]
+            meta_name_tensor = torch.full((t.shape[0],), df_id, dtype=torch.long)
+        else:
+            meta_name_tensor = None
+        trend_all = _to_np(m.model.trend(t, meta_name_tensor))
+        cache[key] = trend_all
+    trend = trend_all[:, :, quantile_index].squeeze()
+    return trend * data_params["y"].scale + data_params["y"].shift
+
+
+def _seasonality_fn(m):
+    """Return a cached, optionally JIT-compiled handle on the model's seasonality module.
+
+    Falls back to the eager bound method when scripting is not supported.
+    """
+    try:
+        return m.model._seasonality_fn
+    except AttributeError:
+        pass
+    fn = m.model.seasonality
+    try:
+        with warnings.catch_warnings():
+            # torch.jit.script is deprecated on recent torch; the attempt is still harmless
+            warnings.simplefilter("ignore", DeprecationWarning)
+            fn = torch.jit.script(fn)
+    except Exception:
+        log.debug("Could not JIT-compile the seasonality module, staying eager.")
+    m.model._seasonality_fn = fn
+    return fn
+
+
+def _plot_layout_cache(m):
+    """Collect the component name lists once and cache them on the model for repeated plot calls."""
+    try:
+        return m.model._plot_layout_cache
+    except AttributeError:
+        pass
+    cache = {
+        "regressor_names": list(m.config_regressors.keys()) if m.config_regressors is not None else [],
+        "event_names": list(m.config_events.keys()) if m.config_events is not None else [],
+        "lagged_scalar_names": [],
+        "lagged_vector_names": [],
+    }
+    if m.config_lagged_regressors is not None:
+        for name, configs in m.config_lagged_regressors.items():
+            cache["lagged_scalar_names" if configs.as_scalar else "lagged_vector_names"].append(name)
+    m.model._plot_layout_cache = cache
+    return cache
+
+
+@lru_cache(maxsize=None)
+def _yearly_grid(yearly_start):
+    """Return the cached Jan 1 - Dec 31 date grid for the yearly seasonality plot."""
+    days = pd.date_range(start="2017-01-01", periods=365) + pd.Timedelta(days=yearly_start)
+    return days, days.to_pydatetime()
 
-def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_start=0, figsize=None, df_name=None):
+
+@lru_cache(maxsize=None)
+def _weekly_grid(weekly_start):
+    """Return the cached hourly Sun-Sat date grid and day names for the weekly seasonality plot."""
+    days_i = pd.date_range(start="2017-01-01", periods=7 * 24, freq="H") + pd.Timedelta(days=weekly_start)
+    days = pd.date_range(start="2017-01-01", periods=7) + pd.Timedelta(days=weekly_start)
+    return days_i, days.day_name()
+
+
+@lru_cache(maxsize=None)
+def _daily_grid():
+    """Return the cached 5-minutely date grid for the daily seasonality plot."""
+    return pd.date_range(start="2017-01-01", periods=24 * 12, freq="5min")
+
+
+@torch.no_grad()
+def plot_parameters(
+    m, quantile, forecast_in_focus=None, weekly_start=0, yearly_start=0, figsize=None, df_name=None, reuse_fig=None
+):
     """Plot the parameters that the model is composed of, visually.
 
     Parameters
@@ -58,6 +224,12 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
             Note
             ----
             Only used for local normalization in global modeling
+        reuse_fig : matplotlib.pyplot.figure
+            Figure from a previous call whose artists are updated in place instead of drawing anew
+
+            Note
+            ----
+            The panel layout must be unchanged between calls, e.g. when sweeping over quantiles
 
     Returns
     -------
@@ -76,6 +248,7 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
     >>> fig_param = m.plot_parameters()
 
     """
+    _use_non_interactive_backend()
     # Set to True in case of local normalization and unknown_data_params is not True
     overwriting_unknown_data_normalization = False
     if m.config_normalization.global_normalization:
@@ -117,12 +290,15 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
             {
                 "plot_name": "lagged weights",
                 "comp_name": "AR",
-                "weights": m.model.ar_weights.detach().numpy(),
+                "weights": _to_np(m.model.ar_weights),
                 "focus": forecast_in_focus,
             }
         )
 
-    quantile_index = m.model.quantiles.index(quantile)
+    quantile_index = _quantile_index(m.model, quantile)
+    layout = _plot_layout_cache(m)
+    # resolve the time series id once; the child helpers then skip the per-call dict lookup
+    df_id = m.model.id_dict.get(df_name) if df_name != "__df__" else None
 
     # all scalar regressors will be plotted together
     # collected as tuples (name, weights)
@@ -130,14 +306,16 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
     # Add Regressors
     additive_future_regressors = []
     multiplicative_future_regressors = []
-    if m.config_regressors is not None:
-        for regressor, configs in m.config_regressors.items():
-            mode = configs.mode
-            regressor_param = m.model.get_reg_weights(regressor)[quantile_index, :]
-            if mode == "additive":
-                additive_future_regressors.append((regressor, regressor_param.detach().numpy()))
+    regressor_names = layout["regressor_names"]
+    if regressor_names:
+        # batch all regressor tensors into one stack, one slice and one numpy conversion
+        stacked = _to_np(torch.stack([m.model.get_reg_weights(name) for name in regressor_names]))
+        stacked = stacked[:, quantile_index, :]
+        for regressor, regressor_param in zip(regressor_names, stacked):
+            if m.config_regressors[regressor].mode == "additive":
+                additive_future_regressors.append((regressor, regressor_param))
             else:
-                multiplicative_future_regressors.append((regressor, regressor_param.detach().numpy()))
+                multiplicative_future_regressors.append((regressor, regressor_param))
 
     additive_events = []
     multiplicative_events = []
@@ -146,39 +324,39 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
     if m.config_country_holidays is not None:
         for country_holiday in m.config_country_holidays.holiday_names:
             event_params = m.model.get_event_weights(country_holiday)
-            weight_list = [(key, param.detach().numpy()[quantile_index, :]) for key, param in event_params.items()]
+            # stack the per-offset params and convert them with a single slice
+            stacked = _to_np(torch.stack(list(event_params.values())))[:, quantile_index, :]
+            weight_list = list(zip(event_params.keys(), stacked))
             mode = m.config_country_holidays.mode
             if mode == "additive":
-                additive_events = additive_events + weight_list
+                additive_events.extend(weight_list)
             else:
-                multiplicative_events = multiplicative_events + weight_list
+                multiplicative_events.extend(weight_list)
 
     # add the user specified events
-    if m.config_events is not None:
-        for event, configs in m.config_events.items():
-            event_params = m.model.get_event_weights(event)
-            weight_list = [(key, param.detach().numpy()[quantile_index, :]) for key, param in event_params.items()]
-            mode = configs.mode
-            if mode == "additive":
-                additive_events = additive_events + weight_list
-            else:
-                multiplicative_events = multiplicative_events + weight_list
+    for event in layout["event_names"]:
+        event_params = m.model.get_event_weights(event)
+        stacked = _to_np(torch.stack(list(event_params.values())))[:, quantile_index, :]
+        weight_list = list(zip(event_params.keys(), stacked))
+        mode = m.config_events[event].mode
+        if mode == "additive":
+            additive_events.extend(weight_list)
+        else:
+            multiplicative_events.extend(weight_list)
 
     # Add lagged regressors
     lagged_scalar_regressors = []
-    if m.config_lagged_regressors is not None:
-        for name in m.config_lagged_regressors.keys():
-            if m.config_lagged_regressors[name].as_scalar:
-                lagged_scalar_regressors.append((name, m.model.get_covar_weights(name).detach().numpy()))
-            else:
-                components.append(
-                    {
-                        "plot_name": "lagged weights",
-                        "comp_name": f'Lagged Regressor "{name}"',
-                        "weights": m.model.get_covar_weights(name).detach().numpy(),
-                        "focus": forecast_in_focus,
-                    }
-                )
+    for name in layout["lagged_scalar_names"]:
+        lagged_scalar_regressors.append((name, _to_np(m.model.get_covar_weights(name))))
+    for name in layout["lagged_vector_names"]:
+        components.append(
+            {
+                "plot_name": "lagged weights",
+                "comp_name": f'Lagged Regressor "{name}"',
+                "weights": _to_np(m.model.get_covar_weights(name)),
+                "focus": forecast_in_focus,
+            }
+        )
 
     if len(additive_future_regressors) > 0:
         components.append({"plot_name": "Additive future regressor"})
@@ -189,38 +367,104 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
     if len(additive_events) > 0:
         data_params = m.config_normalization.get_data_params(df_name)
         scale = data_params["y"].scale
-        additive_events = [(key, weight * scale) for (key, weight) in additive_events]
+        # rescale all event weights with one stacked multiplication
+        event_names, event_weights = zip(*additive_events)
+        additive_events = list(zip(event_names, np.stack(event_weights) * scale))
         components.append({"plot_name": "Additive event"})
     if len(multiplicative_events) > 0:
         components.append({"plot_name": "Multiplicative event"})
 
     npanel = len(components)
     figsize = figsize if figsize else (10, 3 * npanel)
-    fig, axes = plt.subplots(npanel, 1, facecolor="w", figsize=figsize)
-    if npanel == 1:
-        axes = [axes]
+    saved_artists = getattr(reuse_fig, "_np_artists", None) if reuse_fig is not None else None
+    if saved_artists is not None and len(saved_artists) == npanel:
+        fig = reuse_fig
+        axes = fig.axes
+    else:
+        saved_artists = None
+        fig, axes = plt.subplots(npanel, 1, facecolor="w", figsize=figsize)
+        if npanel == 1:
+            axes = [axes]
     multiplicative_axes = []
-    for ax, comp in zip(axes, components):
+    panel_artists = []
+    for panel_index, (ax, comp) in enumerate(zip(axes, components)):
+        to_update = saved_artists[panel_index] if saved_artists is not None else None
         plot_name = comp["plot_name"].lower()
         if plot_name.startswith("trend"):
             if "change" in plot_name:
-                plot_trend_change(m=m, quantile=quantile, ax=ax, plot_name=comp["plot_name"], df_name=df_name)
+                artists = plot_trend_change(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    plot_name=comp["plot_name"],
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
             else:
-                plot_trend(m=m, quantile=quantile, ax=ax, plot_name=comp["plot_name"], df_name=df_name)
+                artists = plot_trend(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    plot_name=comp["plot_name"],
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
         elif plot_name.startswith("seasonality"):
             name = comp["comp_name"]
             if m.config_season.mode == "multiplicative":
                 multiplicative_axes.append(ax)
             if name.lower() == "weekly" or m.config_season.periods[name].period == 7:
-                plot_weekly(m=m, quantile=quantile, ax=ax, weekly_start=weekly_start, comp_name=name, df_name=df_name)
+                artists = plot_weekly(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    weekly_start=weekly_start,
+                    comp_name=name,
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
             elif name.lower() == "yearly" or m.config_season.periods[name].period == 365.25:
-                plot_yearly(m=m, quantile=quantile, ax=ax, yearly_start=yearly_start, comp_name=name, df_name=df_name)
+                artists = plot_yearly(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    yearly_start=yearly_start,
+                    comp_name=name,
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
             elif name.lower() == "daily" or m.config_season.periods[name].period == 1:
-                plot_daily(m=m, quantile=quantile, ax=ax, comp_name=name, df_name=df_name)
+                artists = plot_daily(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    comp_name=name,
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
             else:
-                plot_custom_season(m=m, quantile=quantile, ax=ax, comp_name=name, df_name=df_name)
+                artists = plot_custom_season(
+                    m=m,
+                    quantile=quantile,
+                    ax=ax,
+                    comp_name=name,
+                    df_name=df_name,
+                    artists_to_update=to_update,
+                    df_id=df_id,
+                )
         elif plot_name == "lagged weights":
-            plot_lagged_weights(weights=comp["weights"], comp_name=comp["comp_name"], focus=comp["focus"], ax=ax)
+            artists = plot_lagged_weights(
+                weights=comp["weights"],
+                comp_name=comp["comp_name"],
+                focus=comp["focus"],
+                ax=ax,
+                artists_to_update=to_update,
+            )
         else:
             if plot_name == "additive future regressor":
                 weights = additive_future_regressors
@@ -234,8 +478,17 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
             elif plot_name == "multiplicative event":
                 multiplicative_axes.append(ax)
                 weights = multiplicative_events
-            plot_scalar_weights(weights=weights, plot_name=comp["plot_name"], focus=forecast_in_focus, ax=ax)
-    fig.tight_layout()
+            artists = plot_scalar_weights(
+                weights=weights,
+                plot_name=comp["plot_name"],
+                focus=forecast_in_focus,
+                ax=ax,
+                artists_to_update=to_update,
+            )
+        panel_artists.append(artists)
+    fig._np_artists = panel_artists
+    if saved_artists is None:
+        fig.tight_layout()
     # Reset multiplicative axes labels after tight_layout adjustment
     for ax in multiplicative_axes:
         ax = set_y_as_percent(ax)
@@ -246,7 +499,16 @@ def plot_parameters(m, quantile, forecast_in_focus=None, weekly_start=0, yearly_
     return fig
 
 
-def plot_trend_change(m, quantile, ax=None, plot_name="Trend Change", figsize=(10, 6), df_name="__df__"):
+def plot_trend_change(
+    m,
+    quantile,
+    ax=None,
+    plot_name="Trend Change",
+    figsize=(10, 6),
+    df_name="__df__",
+    artists_to_update=None,
+    df_id=None,
+):
     """Make a barplot of the magnitudes of trend-changes.
 
     Parameters
@@ -286,19 +548,29 @@ def plot_trend_change(m, quantile, ax=None, plot_name="Trend Change", figsize=(1
     start = data_params["ds"].shift
     scale = data_params["ds"].scale
     time_span_seconds = scale.total_seconds()
-    cp_t = []
-    for cp in m.model.config_trend.changepoints:
-        cp_t.append(start + datetime.timedelta(seconds=cp * time_span_seconds))
+    cps = np.asarray(m.model.config_trend.changepoints, dtype=np.float64)
+    n_cp = len(cps)
+    # fill preallocated buffers including the end-point, avoiding the extra np.append copies
+    cp_secs = np.empty(n_cp + 1)
+    np.multiply(cps, time_span_seconds, out=cp_secs[:n_cp])
+    cp_secs[n_cp] = time_span_seconds
+    cp_t = pd.to_datetime(start) + pd.to_timedelta(cp_secs, unit="s")
     # Global/Local Mode
     if m.model.config_trend.trend_global_local == "local":
-        quantile_index = m.model.quantiles.index(quantile)
-        weights = m.model.get_trend_deltas.detach()[quantile_index, m.model.id_dict[df_name], :].numpy()
+        quantile_index = _quantile_index(m.model, quantile)
+        if df_id is None:
+            df_id = m.model.id_dict[df_name]
+        weights = m.model.get_trend_deltas.detach()[quantile_index, df_id, :].numpy()
     else:
-        quantile_index = m.model.quantiles.index(quantile)
+        quantile_index = _quantile_index(m.model, quantile)
         weights = m.model.get_trend_deltas.detach()[quantile_index, 0, :].numpy()
-    # add end-point to force scale to match trend plot
-    cp_t.append(start + scale)
-    weights = np.append(weights, [0.0])
+    # the end-point weight of zero forces the scale to match the trend plot
+    weights_buf = np.empty(n_cp + 1)
+    weights_buf[:n_cp] = weights
+    weights_buf[n_cp] = 0.0
+    weights = weights_buf
+    if artists_to_update is not None:
+        return _update_bar_artists(artists_to_update, weights)
     width = time_span_seconds / 175000 / m.config_trend.n_changepoints
     artists += ax.bar(cp_t, weights, width=width, color="#0072B2")
     locator = AutoDateLocator(interval_multiples=False)
@@ -311,7 +583,10 @@ def plot_trend_change(m, quantile, ax=None, plot_name="Trend Change", figsize=(1
     return artists
 
 
-def plot_trend(m, quantile, ax=None, plot_name="Trend", figsize=(10, 6), df_name="__df__"):
+@torch.no_grad()
+def plot_trend(
+    m, quantile, ax=None, plot_name="Trend", figsize=(10, 6), df_name="__df__", artists_to_update=None, df_id=None
+):
     """Make a barplot of the magnitudes of trend-changes.
 
     Parameters
@@ -350,30 +625,33 @@ def plot_trend(m, quantile, ax=None, plot_name="Trend", figsize=(10, 6), df_name
     data_params = m.config_normalization.get_data_params(df_name)
     t_start = data_params["ds"].shift
     t_end = t_start + data_params["ds"].scale
-    quantile_index = m.model.quantiles.index(quantile)
+    quantile_index = _quantile_index(m.model, quantile)
     if m.config_trend.n_changepoints == 0:
+        shift = data_params["y"].shift
+        scale = data_params["y"].scale
         fcst_t = pd.Series([t_start, t_end]).dt.to_pydatetime()
-        trend_0 = m.model.bias[quantile_index].detach().numpy().squeeze()
+        trend_0 = m.model.bias[quantile_index].numpy().squeeze()
         if m.config_trend.growth == "off":
             trend_1 = trend_0
         else:
             if m.model.config_trend.trend_global_local == "local":
-                trend_1 = trend_0 + m.model.trend_k0[quantile_index, m.model.id_dict[df_name]].detach().numpy()
+                if df_id is None:
+                    df_id = m.model.id_dict[df_name]
+                trend_1 = trend_0 + m.model.trend_k0[quantile_index, df_id].numpy()
             else:
-                trend_1 = trend_0 + m.model.trend_k0[quantile_index, 0].detach().numpy()
+                trend_1 = trend_0 + m.model.trend_k0[quantile_index, 0].numpy()
 
-        data_params = m.config_normalization.get_data_params(df_name)
-        shift = data_params["y"].shift
-        scale = data_params["y"].scale
         trend_0 = trend_0 * scale + shift
         trend_1 = trend_1 * scale + shift
+        if artists_to_update is not None:
+            return _update_line_artists(artists_to_update, [trend_0, trend_1])
         artists += ax.plot(fcst_t, [trend_0, trend_1], ls="-", c="#0072B2")
     else:
         days = pd.date_range(start=t_start, end=t_end, freq=m.data_freq)
-        df_y = pd.DataFrame({"ds": days})
-        df_y["ID"] = df_name
-        df_trend = m.predict_trend(df=df_y, quantile=quantile)
-        artists += ax.plot(df_y["ds"].dt.to_pydatetime(), df_trend["trend"], ls="-", c="#0072B2")
+        trend = _trend_from_model(m, days, quantile_index, df_name, data_params, df_id=df_id)
+        if artists_to_update is not None:
+            return _update_line_artists(artists_to_update, trend)
+        artists += ax.plot(days.to_pydatetime(), trend, ls="-", c="#0072B2")
     # Specify formatting to workaround matplotlib issue #12925
     locator = AutoDateLocator(interval_multiples=False)
     formatter = AutoDateFormatter(locator)
@@ -385,7 +663,7 @@ def plot_trend(m, quantile, ax=None, plot_name="Trend", figsize=(10, 6), df_name
     return artists
 
 
-def plot_scalar_weights(weights, plot_name, focus=None, ax=None, figsize=(10, 6)):
+def plot_scalar_weights(weights, plot_name, focus=None, ax=None, figsize=(10, 6), artists_to_update=None):
     """Make a barplot of the regressor weights.
 
     Parameters
@@ -429,6 +707,8 @@ def plot_scalar_weights(weights, plot_name, focus=None, ax=None, figsize=(10, 6)
             else:
                 weight = np.mean(weight)
         values.append(weight)
+    if artists_to_update is not None:
+        return _update_bar_artists(artists_to_update, values)
     artists += ax.bar(names, values, width=0.8, color="#0072B2")
     ax.grid(True, which="major", c="gray", ls="-", lw=1, alpha=0.2)
     ax.set_xlabel(plot_name + " name")
@@ -447,7 +727,7 @@ def plot_scalar_weights(weights, plot_name, focus=None, ax=None, figsize=(10, 6)
     return artists
 
 
-def plot_lagged_weights(weights, comp_name, focus=None, ax=None, figsize=(10, 6)):
+def plot_lagged_weights(weights, comp_name, focus=None, ax=None, figsize=(10, 6), artists_to_update=None):
     """Make a barplot of the importance of lagged inputs.
 
     Parameters
@@ -477,14 +757,18 @@ def plot_lagged_weights(weights, comp_name, focus=None, ax=None, figsize=(10, 6)
         fig = plt.figure(facecolor="w", figsize=figsize)
         ax = fig.add_subplot(111)
     n_lags = weights.shape[1]
-    lags_range = list(range(1, 1 + n_lags))[::-1]
+    lags_range = np.arange(n_lags, 0, -1)
     if focus is None:
-        weights = np.sum(np.abs(weights), axis=0)
-        weights = weights / np.sum(weights)
+        weights = np.abs(weights).sum(axis=0)
+        weights *= 1.0 / weights.sum()
+        if artists_to_update is not None:
+            return _update_bar_artists(artists_to_update, weights)
         artists += ax.bar(lags_range, weights, width=1.00, color="#0072B2")
     else:
         if len(weights.shape) == 2:
             weights = weights[focus - 1, :]
+        if artists_to_update is not None:
+            return _update_bar_artists(artists_to_update, weights)
         artists += ax.bar(lags_range, weights, width=0.80, color="#0072B2")
     ax.grid(True, which="major", c="gray", ls="-", lw=1, alpha=0.2)
     ax.set_xlabel(f"{comp_name} lag number")
@@ -496,24 +780,24 @@ def plot_lagged_weights(weights, comp_name, focus=None, ax=None, figsize=(10, 6)
     return artists
 
 
-def predict_one_season(m, quantile, name, n_steps=100, df_name="__df__"):
+@torch.no_grad()
+def predict_one_season(m, quantile, name, n_steps=100, df_name="__df__", df_id=None):
     config = m.config_season.periods[name]
     t_i = np.arange(n_steps + 1) / float(n_steps)
-    features = time_dataset.fourier_series_t(
-        t=t_i * config.period, period=config.period, series_order=config.resolution
-    )
-    features = torch.from_numpy(np.expand_dims(features, 1))
+    features = _fourier_series_t(t_i * config.period, config.period, config.resolution)
+    features = torch.from_numpy(features).unsqueeze(1)
 
-    if df_name == "__df__":
+    if df_id is None and df_name != "__df__":
+        df_id = m.model.id_dict[df_name]
+    if df_id is None:
         meta_name_tensor = None
     else:
-        meta = OrderedDict()
-        meta["df_name"] = [df_name for _ in range(n_steps + 1)]
-        meta_name_tensor = torch.tensor([m.model.id_dict[i] for i in meta["df_name"]])
+        # the id is identical for every step, no need to build it element by element
+        meta_name_tensor = torch.full((n_steps + 1,), df_id, dtype=torch.long)
 
-    quantile_index = m.model.quantiles.index(quantile)
-    predicted = m.model.seasonality(features=features, name=name, meta=meta_name_tensor)[:, :, quantile_index]
-    predicted = predicted.squeeze().detach().numpy()
+    quantile_index = _quantile_index(m.model, quantile)
+    predicted = _seasonality_fn(m)(features=features, name=name, meta=meta_name_tensor)[:, :, quantile_index]
+    predicted = predicted.squeeze().numpy()
     if m.config_season.mode == "additive":
         data_params = m.config_normalization.get_data_params(df_name)
         scale = data_params["y"].scale
@@ -521,21 +805,24 @@ def predict_one_season(m, quantile, name, n_steps=100, df_name="__df__"):
     return t_i, predicted
 
 
-def predict_season_from_dates(m, dates, name, quantile, df_name="__df__"):
+@torch.no_grad()
+def predict_season_from_dates(m, dates, name, quantile, df_name="__df__", df_id=None):
     config = m.config_season.periods[name]
-    features = time_dataset.fourier_series(dates=dates, period=config.period, series_order=config.resolution)
-    features = torch.from_numpy(np.expand_dims(features, 1))
-    if df_name == "__df__":
+    # convert to float days since epoch and evaluate the Fourier features directly
+    t = np.asarray(dates, dtype="datetime64[ns]").astype(np.int64) / (3600 * 24.0 * 1e9)
+    features = _fourier_series_t(t, config.period, config.resolution)
+    features = torch.from_numpy(features).unsqueeze(1)
+    if df_id is None and df_name != "__df__":
+        df_id = m.model.id_dict[df_name]
+    if df_id is None:
         meta_name_tensor = None
     else:
-        meta = OrderedDict()
-        meta["df_name"] = [df_name for _ in range(len(dates))]
-        meta_name_tensor = torch.tensor([m.model.id_dict[i] for i in meta["df_name"]])
+        meta_name_tensor = torch.full((len(dates),), df_id, dtype=torch.long)
 
-    quantile_index = m.model.quantiles.index(quantile)
-    predicted = m.model.seasonality(features=features, name=name, meta=meta_name_tensor)[:, :, quantile_index]
+    quantile_index = _quantile_index(m.model, quantile)
+    predicted = _seasonality_fn(m)(features=features, name=name, meta=meta_name_tensor)[:, :, quantile_index]
 
-    predicted = predicted.squeeze().detach().numpy()
+    predicted = predicted.squeeze().numpy()
     if m.config_season.mode == "additive":
         data_params = m.config_normalization.get_data_params(df_name)
         scale = data_params["y"].scale
@@ -543,7 +830,9 @@ def predict_season_from_dates(m, dates, name, quantile, df_name="__df__"):
     return predicted
 
 
-def plot_custom_season(m, comp_name, quantile, ax=None, figsize=(10, 6), df_name="__df__"):
+def plot_custom_season(
+    m, comp_name, quantile, ax=None, figsize=(10, 6), df_name="__df__", artists_to_update=None, df_id=None
+):
     """Plot any seasonal component of the forecast.
 
     Parameters
@@ -577,7 +866,11 @@ def plot_custom_season(m, comp_name, quantile, ax=None, figsize=(10, 6), df_name
             List of Artist objects containing seasonal forecast component
 
     """
-    t_i, predicted = predict_one_season(m, name=comp_name, n_steps=300, quantile=quantile, df_name=df_name)
+    t_i, predicted = predict_one_season(
+        m, name=comp_name, n_steps=300, quantile=quantile, df_name=df_name, df_id=df_id
+    )
+    if artists_to_update is not None:
+        return _update_line_artists(artists_to_update, predicted)
     artists = []
     if not ax:
         fig = plt.figure(facecolor="w", figsize=figsize)
@@ -590,7 +883,16 @@ def plot_custom_season(m, comp_name, quantile, ax=None, figsize=(10, 6), df_name
 
 
 def plot_yearly(
-    m, quantile, comp_name="yearly", yearly_start=0, quick=True, ax=None, figsize=(10, 6), df_name="__df__"
+    m,
+    quantile,
+    comp_name="yearly",
+    yearly_start=0,
+    quick=True,
+    ax=None,
+    figsize=(10, 6),
+    df_name="__df__",
+    artists_to_update=None,
+    df_id=None,
 ):
     """Plot the yearly component of the forecast.
 
@@ -636,13 +938,16 @@ def plot_yearly(
         fig = plt.figure(facecolor="w", figsize=figsize)
         ax = fig.add_subplot(111)
     # Compute yearly seasonality for a Jan 1 - Dec 31 sequence of dates.
-    days = pd.date_range(start="2017-01-01", periods=365) + pd.Timedelta(days=yearly_start)
-    df_y = pd.DataFrame({"ds": days})
+    days, days_pydt = _yearly_grid(yearly_start)
     if quick:
-        predicted = predict_season_from_dates(m, dates=df_y["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+        predicted = predict_season_from_dates(
+            m, dates=days, name=comp_name, quantile=quantile, df_name=df_name, df_id=df_id
+        )
     else:
-        predicted = m.predict_seasonal_components({df_name: df_y}, quantile=quantile)[comp_name]
-    artists += ax.plot(df_y["ds"].dt.to_pydatetime(), predicted, ls="-", c="#0072B2")
+        predicted = m.predict_seasonal_components({df_name: pd.DataFrame({"ds": days})}, quantile=quantile)[comp_name]
+    if artists_to_update is not None:
+        return _update_line_artists(artists_to_update, predicted)
+    artists += ax.plot(days_pydt, predicted, ls="-", c="#0072B2")
     ax.grid(True, which="major", c="gray", ls="-", lw=1, alpha=0.2)
     months = MonthLocator(range(1, 13), bymonthday=1, interval=2)
     ax.xaxis.set_major_formatter(FuncFormatter(lambda x, pos=None: f"{num2date(x):%B} {num2date(x).day}"))
@@ -653,7 +958,16 @@ def plot_yearly(
 
 
 def plot_weekly(
-    m, quantile, comp_name="weekly", weekly_start=0, quick=True, ax=None, figsize=(10, 6), df_name="__df__"
+    m,
+    quantile,
+    comp_name="weekly",
+    weekly_start=0,
+    quick=True,
+    ax=None,
+    figsize=(10, 6),
+    df_name="__df__",
+    artists_to_update=None,
+    df_id=None,
 ):
     """Plot the weekly component of the forecast.
 
@@ -699,14 +1013,17 @@ def plot_weekly(
         fig = plt.figure(facecolor="w", figsize=figsize)
         ax = fig.add_subplot(111)
     # Compute weekly seasonality for a Sun-Sat sequence of dates.
-    days_i = pd.date_range(start="2017-01-01", periods=7 * 24, freq="H") + pd.Timedelta(days=weekly_start)
-    df_w = pd.DataFrame({"ds": days_i})
+    days_i, days = _weekly_grid(weekly_start)
     if quick:
-        predicted = predict_season_from_dates(m, dates=df_w["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+        predicted = predict_season_from_dates(
+            m, dates=days_i, name=comp_name, quantile=quantile, df_name=df_name, df_id=df_id
+        )
     else:
-        predicted = m.predict_seasonal_components({df_name: df_w}, quantile=quantile)[comp_name]
-    days = pd.date_range(start="2017-01-01", periods=7) + pd.Timedelta(days=weekly_start)
-    days = days.day_name()
+        predicted = m.predict_seasonal_components({df_name: pd.DataFrame({"ds": days_i})}, quantile=quantile)[
+            comp_name
+        ]
+    if artists_to_update is not None:
+        return _update_line_artists(artists_to_update, predicted)
     artists += ax.plot(range(len(days_i)), predicted, ls="-", c="#0072B2")
     ax.grid(True, which="major", c="gray", ls="-", lw=1, alpha=0.2)
     ax.set_xticks(24 * np.arange(len(days) + 1))
@@ -716,7 +1033,17 @@ def plot_weekly(
     return artists
 
 
-def plot_daily(m, quantile, comp_name="daily", quick=True, ax=None, figsize=(10, 6), df_name="__df__"):
+def plot_daily(
+    m,
+    quantile,
+    comp_name="daily",
+    quick=True,
+    ax=None,
+    figsize=(10, 6),
+    df_name="__df__",
+    artists_to_update=None,
+    df_id=None,
+):
     """Plot the daily component of the forecast.
 
     Parameters
@@ -754,12 +1081,15 @@ def plot_daily(m, quantile, comp_name="daily", quick=True, ax=None, figsize=(10,
         fig = plt.figure(facecolor="w", figsize=figsize)
         ax = fig.add_subplot(111)
     # Compute daily seasonality
-    dates = pd.date_range(start="2017-01-01", periods=24 * 12, freq="5min")
-    df = pd.DataFrame({"ds": dates})
+    dates = _daily_grid()
     if quick:
-        predicted = predict_season_from_dates(m, dates=df["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+        predicted = predict_season_from_dates(
+            m, dates=dates, name=comp_name, quantile=quantile, df_name=df_name, df_id=df_id
+        )
     else:
-        predicted = m.predict_seasonal_components({df_name: df}, quantile=quantile)[comp_name]
+        predicted = m.predict_seasonal_components({df_name: pd.DataFrame({"ds": dates})}, quantile=quantile)[comp_name]
+    if artists_to_update is not None:
+        return _update_line_artists(artists_to_update, predicted)
     artists += ax.plot(range(len(dates)), predicted, ls="-", c="#0072B2")
     ax.grid(True, which="major", c="gray", ls="-", lw=1, alpha=0.2)
     ax.set_xticks(12 * np.arange(25))
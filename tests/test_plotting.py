@@ -4,10 +4,12 @@ import logging
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from neuralprophet import NeuralProphet
+from neuralprophet.plot_model_parameters import plot_parameters
 
 log = logging.getLogger("NP.test")
 log.setLevel("DEBUG")
@@ -403,6 +405,30 @@ def test_plotly_uncertainty():
         fig6.show()
 
 
+def test_reuse_fig_parameters():
+    log.info("testing: Refreshing the parameter plot in place with reuse_fig")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, quantiles=[0.1, 0.9])
+    metrics_df = m.fit(df, freq="D")
+
+    fig1 = plot_parameters(m, quantile=0.9)
+    fig2 = plot_parameters(m, quantile=0.1, reuse_fig=fig1)
+    assert fig2 is fig1
+
+    # the refreshed artists must carry the same data as a freshly drawn figure
+    fig3 = plot_parameters(m, quantile=0.1)
+    for panel_updated, panel_fresh in zip(fig2._np_artists, fig3._np_artists):
+        assert len(panel_updated) == len(panel_fresh)
+        for artist_updated, artist_fresh in zip(panel_updated, panel_fresh):
+            if hasattr(artist_updated, "get_ydata"):
+                assert np.allclose(artist_updated.get_ydata(), artist_fresh.get_ydata())
+            else:
+                assert np.allclose(artist_updated.get_height(), artist_fresh.get_height())
+
+    if PLOT:
+        fig2.show()
+
+
 def test_plotly_latest_forecast():
     log.info("testing: Plotting of latest forecast with plotly")
     df = pd.read_csv(PEYTON_FILE, nrows=NROWS)